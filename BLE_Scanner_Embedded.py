@@ -15,20 +15,41 @@ import asyncio
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 from bleak import BleakScanner, BleakClient
+from bleak.exc import BleakError
 import threading
 import time
-from datetime import datetime
 import sys
+from collections import deque
 from typing import Dict, Any, Optional, List, Callable
+from concurrent.futures import Future
 from functools import wraps
 
+try:
+    import uvloop  # Optional libuv-based event loop (Linux/macOS)
+except ImportError:
+    uvloop = None
+
 # Configuration constants
-SCAN_TIMEOUT = 2.0  # Seconds for each scan cycle
-SCAN_INTERVAL = 2.0  # Seconds between scan cycles
+SCAN_CHECK_INTERVAL = 0.25  # Seconds between scan stop-flag checks
+RSSI_UPDATE_THRESHOLD = 3  # Minimum RSSI change (dBm) that triggers a GUI update
+DEVICE_TIMEOUT = 60.0  # Seconds without an advertisement before a device is dropped
+DEVICE_PRUNE_INTERVAL = 5.0  # Seconds between stale device sweeps while scanning
 POLLING_INTERVAL = 0.5  # Seconds between polling reads
-NOTIFICATION_CHECK_INTERVAL = 0.1  # Seconds between notification queue checks
-CLEANUP_TIMEOUT = 2.0  # Seconds to wait for cleanup completion
+NOTIFICATION_CHECK_INTERVAL = 0.1  # Max seconds between notification stop-flag checks
+NOTIFICATION_QUEUE_SIZE = 1024  # Max queued notifications before the oldest are dropped
+NOTIFY_RETRY_DELAYS = (0.1, 0.3, 1.0)  # Seconds to back off between start_notify attempts
+CLEANUP_TIMEOUT = 5.0  # Max seconds to wait for cleanup before force closing
+UNPAIR_CONCURRENCY = 5  # Max devices unpaired at once during cleanup
 DEFAULT_RSSI = -50  # Default RSSI value when not available
+# BlueZ connection interval tuning (Linux only, needs write access to debugfs).
+# These are adapter-wide defaults shared by every application on the host, so
+# they are only applied while a connection is being created and then restored.
+CONN_MIN_INTERVAL = 8  # Minimum connection interval in 1.25 ms units (10 ms)
+CONN_MAX_INTERVAL = 9  # Maximum connection interval in 1.25 ms units (11.25 ms)
+BLUEZ_DEBUGFS_DIR = "/sys/kernel/debug/bluetooth/hci0"
+NON_UTF8_BYTES = bytes([0xC0, 0xC1]) + bytes(range(0xF5, 0x100))  # Never valid in UTF-8
+WRITE_PROPERTIES = frozenset({"write", "write-without-response"})  # Characteristic can be written
+NOTIFY_PROPERTIES = frozenset({"notify", "indicate"})  # Characteristic can be subscribed to
 
 # GUI configuration
 WIDTH = 800
@@ -37,48 +58,72 @@ TREE_HEIGHT = 15
 SERVICES_TEXT_HEIGHT = 10
 RECEIVED_TEXT_HEIGHT = 8
 LOG_TEXT_HEIGHT = 6
+DEVICE_UPDATE_INTERVAL = 200  # Milliseconds to coalesce device list redraws
+RX_UPDATE_INTERVAL = 33  # Milliseconds to batch received data inserts (~30 Hz)
+RX_QUEUE_SIZE = 10000  # Max received messages buffered between batches
+LOG_UPDATE_INTERVAL = 50  # Milliseconds to coalesce log writes
+MAX_TEXT_LINES = 2000  # Lines kept in the log/received text widgets before trimming
+TRIM_TEXT_LINES = 1500  # Lines left after a trim
 
 
 def run_async(func):
-    """Decorator to run async functions in a dedicated event loop thread.
+    """Decorator to run async methods on the owning manager's shared event loop.
+    
+    The decorated coroutine method is scheduled on ``self._loop`` (a single
+    long-lived loop running in a background thread) instead of creating a new
+    thread and event loop for every call.
     
-    Each decorated function will automatically run in its own event loop.
+    Returns:
+        concurrent.futures.Future for the scheduled coroutine
     """
     @wraps(func)
-    def wrapper(*args, **kwargs):
-        def thread_target():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(func(*args, **kwargs))
-            finally:
-                try:
-                    loop.close()
-                except:
-                    pass
-        
-        thread = threading.Thread(target=thread_target, daemon=True)
-        thread.start()
+    def wrapper(self, *args, **kwargs):
+        return self._submit(func(self, *args, **kwargs))
     
     return wrapper
 
 
+# (epoch second, formatted HH:MM:SS) for the most recent get_timestamp() call
+_timestamp_cache = (0, "")
+
+
 def get_timestamp() -> str:
-    """Get current timestamp in HH:MM:SS format."""
-    return datetime.now().strftime("%H:%M:%S")
+    """Get current timestamp in HH:MM:SS format.
+    
+    The formatted string only changes once per second, so it is cached and
+    rebuilt only when the second rolls over.
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    cached_second, cached_str = _timestamp_cache
+    if now != cached_second:
+        cached_str = time.strftime("%H:%M:%S", time.localtime(now))
+        _timestamp_cache = (now, cached_str)
+    return cached_str
 
 
-def format_data_message(data: bytes, message_type: str) -> str:
+def format_data_message(data: bytes, message_type: str, timestamp: Optional[str] = None) -> str:
     """Format BLE data with timestamp and type.
     
     Args:
         data: Raw bytes received from BLE device
         message_type: Type of message (Read, Notification, Polled, etc.)
+        timestamp: HH:MM:SS arrival time; defaults to the current time
         
     Returns:
         Formatted message string with timestamp
     """
-    timestamp = get_timestamp()
+    if timestamp is None:
+        timestamp = get_timestamp()
+    
+    # Pure ASCII is always valid UTF-8, so it can be decoded without the probe
+    if data.isascii():
+        return f"[{timestamp}] {message_type}: '{data.decode('ascii')}'\n"
+    
+    # Bytes that never occur in valid UTF-8 mark the payload as binary, which
+    # skips constructing a UnicodeDecodeError for the common sensor-data case
+    if len(data.translate(None, NON_UTF8_BYTES)) != len(data):
+        return f"[{timestamp}] {message_type} (hex): {data.hex(' ')}\n"
     
     try:
         # Try UTF-8 decoding first
@@ -86,7 +131,7 @@ def format_data_message(data: bytes, message_type: str) -> str:
         return f"[{timestamp}] {message_type}: '{decoded_str}'\n"
     except UnicodeDecodeError:
         # Fall back to hex representation for binary data
-        hex_str = ' '.join([f'{b:02x}' for b in data])
+        hex_str = data.hex(' ')
         return f"[{timestamp}] {message_type} (hex): {hex_str}\n"
 
 
@@ -94,7 +139,7 @@ class BluetoothManager:
     """Handles all Bluetooth Low Energy operations.
     
     This class manages BLE device scanning, connection, pairing, and communication.
-    It uses async operations run in background threads to prevent GUI blocking.
+    It runs async operations on a shared background event loop to prevent GUI blocking.
     All operations provide callbacks to the GUI for status updates.
     
     Attributes:
@@ -104,9 +149,12 @@ class BluetoothManager:
         client: Current BleakClient connection object
         connected: Flag indicating if a device is currently connected
         selected_characteristic: Currently selected BLE characteristic for operations
+        selected_characteristic_uuid: UUID string of the selected characteristic
+        selected_write_response: Whether writes to the selected characteristic need a response
         notification_active: Flag indicating if notifications are active
         paired: Flag indicating if current device is paired
         paired_devices: Set of device addresses paired during this session
+        _loop: Shared asyncio event loop that runs all BLE coroutines
     """
     
     def __init__(self, callback_manager: 'BLEGUIApp') -> None:
@@ -120,68 +168,182 @@ class BluetoothManager:
         self.client: Optional[BleakClient] = None
         self.connected = False
         self.selected_characteristic = None
+        self.selected_characteristic_uuid: Optional[str] = None
+        self.selected_write_response = True
+        self._last_encoded = ("", b"")  # (string, UTF-8 bytes) of the last payload sent
         self.notification_active = False
+        self._stop_event: Optional[asyncio.Event] = None  # Set to wake the polling coroutine
+        self._notify_session: Optional[object] = None  # Token of the current notify/poll session
+        self._notify_future: Optional[Future] = None  # Running try_notifications coroutine
         self.paired = False
         self.paired_devices = set()  # Track devices paired during this session
+        self._scan_future: Optional[Future] = None  # Running scan coroutine
+        self._scan_session: Optional[object] = None  # Token of the current scan; None when stopped
+        self._last_device_prune = 0.0  # Monotonic time of the last stale device sweep
+        self._resume_scan_after_connect = False  # Scan was paused for a connection attempt
+        self._connection_tuning_disabled = False  # debugfs not writable or app closing; skip tuning
+        self._saved_conn_intervals: Optional[Dict[str, str]] = None  # BlueZ defaults to restore
+        self._conn_interval_lock = threading.Lock()  # Serializes tuning (loop thread) and restores
+        self._gatt_lock: Optional[asyncio.Lock] = None  # Serializes GATT operations on the client
+        
+        # Single long-lived event loop shared by all BLE operations
+        self._loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._run_event_loop, daemon=True)
+        self._loop_thread.start()
+    
+    def _run_event_loop(self) -> None:
+        """Run the shared event loop forever in its background thread."""
+        asyncio.set_event_loop(self._loop)
+        # Created here so the lock belongs to the shared loop on every Python version
+        self._gatt_lock = asyncio.Lock()
+        self._loop.run_forever()
+    
+    def _submit(self, coro) -> Future:
+        """Schedule a coroutine on the shared event loop.
+        
+        Args:
+            coro: Coroutine object to run
+            
+        Returns:
+            Future that resolves with the coroutine result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
         
     def start_scan(self) -> None:
         """Start BLE device scanning.
         
         Initiates continuous scanning for BLE devices. 
         Clears existing device list.
-        Starts background scanning thread. 
+        Starts background scanning on the shared event loop. 
         
         Updates GUI through callbacks.
         """
         self.scanning = True
+        self._resume_scan_after_connect = False
         self.devices.clear()
         self.callback_manager.on_scan_started()
         
-        # Run scan in background thread to avoid blocking GUI
-        thread = threading.Thread(target=self._scan_devices_simple, daemon=True)
-        thread.start()
+        # Run scan on the shared event loop to avoid blocking GUI
+        self._scan_session = object()
+        self._scan_future = self._scan_devices_simple(self._scan_session, self._scan_future)
     
     def stop_scan(self) -> None:
         """Stop BLE device scanning.
         
-        Stops the continuous scanning process by setting the scanning flag to False.
-        The background thread will terminate on its next iteration.
+        Stops the continuous scanning process by setting the scanning flag to False
+        and ending the current scan session. The background scan coroutine will
+        terminate on its next iteration, even if a new scan starts before then.
         """
         self.scanning = False
+        self._scan_session = None
+        self._resume_scan_after_connect = False
         self.callback_manager.on_scan_stopped()
     
+    def _resume_scan(self) -> None:
+        """Restart scanning after a connection attempt, keeping discovered devices."""
+        self.scanning = True
+        self.callback_manager.on_scan_resumed()
+        self._scan_session = object()
+        self._scan_future = self._scan_devices_simple(self._scan_session, self._scan_future)
+    
     @run_async
-    async def _scan_devices_simple(self) -> None:
+    async def _scan_devices_simple(self, session: object, previous_scan: Optional[Future] = None) -> None:
         """Background async method for continuous BLE device scanning.
         
-        Performs continuous scanning using BleakScanner.discover() without advertisement
-        data to avoid compatibility issues. Updates device list and notifies GUI of changes.
+        Keeps a single BleakScanner running with a detection callback so devices
+        are reported as their advertisements arrive, instead of repeatedly
+        tearing down and restarting discovery. Runs until scanning is stopped.
+        
+        Args:
+            session: Token of this scan; the scan ends once it is replaced or cleared
+            previous_scan: Future of the scan this one replaces, if any
         """
-        while self.scanning:
-            try:
-                # Discover devices with timeout to prevent hanging
-                devices = await BleakScanner.discover(timeout=SCAN_TIMEOUT)
-                
-                # Process discovered devices
-                for device in devices:
-                    if device.address not in self.devices:
-                        self.devices[device.address] = {
-                            'name': device.name or "Unknown",
-                            'address': device.address,
-                            'rssi': DEFAULT_RSSI,  # Default value since we don't get RSSI in simple scan
-                            'device': device
-                        }
-                        # Notify GUI of device list update
-                        self.callback_manager.on_devices_updated(self.devices)
-                
-                # Wait between scans if still scanning
-                if self.scanning:
-                    await asyncio.sleep(SCAN_INTERVAL)
+        try:
+            # A quick Stop/Start must not start a second scanner before the
+            # previous one has shut down
+            if previous_scan and not previous_scan.done():
+                await asyncio.wrap_future(previous_scan)
+            
+            # Scanning may have been stopped again while waiting
+            if self._scan_session is not session:
+                return
+            
+            async with BleakScanner(detection_callback=self._on_advertisement):
+                while self._scan_session is session:
+                    await asyncio.sleep(SCAN_CHECK_INTERVAL)
+                    if self._scan_session is session:
+                        self._prune_stale_devices()
                     
-            except Exception as e:
-                error_msg = f"Scan error: {str(e)}"
-                self.callback_manager.on_error(error_msg)
-                break
+        except Exception as e:
+            error_msg = f"Scan error: {str(e)}"
+            self.callback_manager.on_error(error_msg)
+    
+    def _on_advertisement(self, device, advertisement_data) -> None:
+        """Detection callback invoked by BleakScanner for each advertisement.
+        
+        Args:
+            device: BLEDevice that sent the advertisement
+            advertisement_data: AdvertisementData carrying the measured RSSI
+            
+        Note:
+            The GUI is only notified when a new device appears, a known
+            device's RSSI changes by more than RSSI_UPDATE_THRESHOLD dBm, or
+            its name becomes known or changes (many devices only send their
+            name in the scan response).
+        """
+        # A scanner that is still shutting down must not add rows after Stop
+        if not self.scanning:
+            return
+        
+        rssi = advertisement_data.rssi if advertisement_data.rssi is not None else DEFAULT_RSSI
+        name = advertisement_data.local_name or device.name
+        now = time.monotonic()
+        device_info = self.devices.get(device.address)
+        
+        if device_info is None:
+            device_info = {
+                'name': name or "Unknown",
+                'address': device.address,
+                'rssi': rssi,
+                'device': device,
+                'last_seen': now
+            }
+            self.devices[device.address] = device_info
+            # Notify GUI of the new device only
+            self.callback_manager.on_device_added(device.address, device_info)
+            return
+        
+        device_info['last_seen'] = now
+        changed = False
+        if name and name != device_info['name']:
+            device_info['name'] = name
+            changed = True
+        if abs(device_info['rssi'] - rssi) > RSSI_UPDATE_THRESHOLD:
+            device_info['rssi'] = rssi
+            changed = True
+        if changed:
+            # Notify GUI of the changed device only
+            self.callback_manager.on_device_updated(device.address, device_info)
+    
+    def _prune_stale_devices(self) -> None:
+        """Drop devices that have not advertised within DEVICE_TIMEOUT seconds.
+        
+        Keeps the device list bounded in busy RF environments. Sweeps run at
+        most every DEVICE_PRUNE_INTERVAL, and the connected device is kept.
+        """
+        now = time.monotonic()
+        if now - self._last_device_prune < DEVICE_PRUNE_INTERVAL:
+            return
+        self._last_device_prune = now
+        
+        connected_address = self.client.address if self.client and self.connected else None
+        stale = [
+            address for address, device_info in self.devices.items()
+            if now - device_info['last_seen'] > DEVICE_TIMEOUT and address != connected_address
+        ]
+        for address in stale:
+            del self.devices[address]
+            self.callback_manager.on_device_removed(address)
     
     def connect_to_device(self, device_address: str) -> None:
         """        
@@ -189,34 +351,47 @@ class BluetoothManager:
             device_address: MAC address of the device to connect to
             
         Note:
-            Connection runs in background thread to prevent GUI blocking.
+            Connection runs on the shared event loop to prevent GUI blocking.
             GUI is updated through callbacks during the connection process.
+            An active scan is paused while connecting, so the controller does
+            not alternate between scanning and initiating, and resumed afterwards.
         """
-        if device_address not in self.devices:
+        device_info = self.devices.get(device_address)
+        if device_info is None:
             self.callback_manager.on_error(f"Device {device_address} not found in discovered devices")
             return
         
-        device_info = self.devices[device_address]
         self.callback_manager.on_connection_started(device_info)
         
-        # Run connection in background thread to avoid blocking GUI
-        thread = threading.Thread(target=self._connect_simple, args=(device_address,), daemon=True)
-        thread.start()
+        if self.scanning:
+            self.stop_scan()
+            self._resume_scan_after_connect = True
+        
+        # Run connection on the shared event loop to avoid blocking GUI.
+        # The entry is passed along because the paused scan leaves Start Scan
+        # clickable, and a new scan clears self.devices mid-connect.
+        self._connect_simple(device_info)
     
     @run_async
-    async def _connect_simple(self, device_address: str) -> None:
+    async def _connect_simple(self, device_info: Dict[str, Any]) -> None:
         """Background async method for BLE device connection.
         Args:
-            device_address: MAC address of the device to connect to
+            device_info: Discovered device entry (name, address, BLEDevice) to connect to
         """
         try:
-            # Create and establish BLE client connection
-            self.client = BleakClient(device_address)
+            # Let a paused scanner shut down before initiating the connection
+            if self._scan_future and not self._scan_future.done():
+                await asyncio.wrap_future(self._scan_future)
+            
+            # Request a short connection interval before the link is created
+            self._tune_connection_interval()
+            
+            # Connect via the discovered BLEDevice so bleak does not rescan for the address
+            self.client = BleakClient(device_info['device'])
             await self.client.connect()
             
             # Update connection status
             self.connected = True
-            device_info = self.devices[device_address]
             self.callback_manager.on_connected(device_info)
             
             # Attempt to discover services and characteristics
@@ -233,18 +408,112 @@ class BluetoothManager:
         except Exception as e:
             error_msg = f"Connection failed: {str(e)}"
             self.callback_manager.on_connection_failed(error_msg)
+        finally:
+            # The link has its parameters now; give other applications the defaults back
+            self.restore_connection_interval()
+            
+            # Resume scanning unless the user changed the scan state meanwhile
+            if self._resume_scan_after_connect:
+                self._resume_scan_after_connect = False
+                self._resume_scan()
+    
+    def _tune_connection_interval(self) -> None:
+        """Lower the BlueZ default connection interval for new connections.
+        
+        A shorter interval reduces the round-trip floor of every GATT read,
+        write and notification. BlueZ applies these defaults when a connection
+        is created, so this must run before connecting.
+        
+        Note:
+            Only supported on Linux, and only when debugfs is mounted and
+            writable (usually requires root). Failures are logged and the
+            connection proceeds with the system defaults. The defaults are
+            adapter-wide, so the previous values are saved and put back by
+            restore_connection_interval once the connection attempt ends.
+        """
+        if not sys.platform.startswith("linux"):
+            return
+        
+        names = ("conn_min_interval", "conn_max_interval")
+        # Held for the whole save-and-write so a restore from the GUI thread
+        # cannot slip in between and leave the tuned values behind
+        with self._conn_interval_lock:
+            if self._connection_tuning_disabled:
+                return
+            try:
+                saved = {}
+                for name in names:
+                    with open(f"{BLUEZ_DEBUGFS_DIR}/{name}") as f:
+                        saved[name] = f.read().strip()
+                self._saved_conn_intervals = saved
+                
+                # Write the minimum first so it never exceeds the current maximum
+                for name, value in zip(names, (CONN_MIN_INTERVAL, CONN_MAX_INTERVAL)):
+                    with open(f"{BLUEZ_DEBUGFS_DIR}/{name}", "w") as f:
+                        f.write(str(value))
+            except OSError as e:
+                self._connection_tuning_disabled = True
+                message = f"Using default connection interval (could not tune: {str(e)})"
+                restore_error = self._write_saved_intervals()
+                if restore_error:
+                    message = f"{message}; {restore_error}"
+            else:
+                message = f"Connection interval set to {CONN_MIN_INTERVAL * 1.25}-{CONN_MAX_INTERVAL * 1.25} ms"
+        
+        # Reported outside the lock: the GUI thread may be waiting on it in
+        # _force_close while tkinter hands this call over to that thread
+        self.callback_manager.on_message(message)
+    
+    def restore_connection_interval(self, final: bool = False) -> None:
+        """Put back the BlueZ connection interval defaults saved by tuning.
+        
+        Args:
+            final: Also block any later tuning; used when the application closes
+            
+        Safe to call from any thread.
+        """
+        with self._conn_interval_lock:
+            if final:
+                self._connection_tuning_disabled = True
+            error = self._write_saved_intervals()
+        if error:
+            self.callback_manager.on_message(error)
+    
+    def _write_saved_intervals(self) -> Optional[str]:
+        """Write the saved defaults back to debugfs; caller holds _conn_interval_lock.
+        
+        Returns:
+            Error message to report once the lock is released, or None
+        """
+        saved = self._saved_conn_intervals
+        if saved is None:
+            return None
+        self._saved_conn_intervals = None
+        
+        # Order the writes so the minimum never exceeds the maximum in between
+        if int(saved["conn_max_interval"]) >= CONN_MIN_INTERVAL:
+            names = ("conn_max_interval", "conn_min_interval")
+        else:
+            names = ("conn_min_interval", "conn_max_interval")
+        try:
+            for name in names:
+                with open(f"{BLUEZ_DEBUGFS_DIR}/{name}", "w") as f:
+                    f.write(saved[name])
+        except OSError as e:
+            return f"Could not restore default connection interval: {str(e)}"
+        return None
     
     def disconnect_from_device(self) -> None:
         """Disconnect from the currently connected BLE device.
         
-        Stops any active notifications and initiates disconnection in background thread.
+        Stops any active notifications and initiates disconnection on the shared event loop.
         Updates GUI state through callbacks upon completion.
         """
         if self.client:
             # Stop notifications before disconnecting
             self.notification_active = False
-            thread = threading.Thread(target=self._disconnect_simple, daemon=True)
-            thread.start()
+            self._signal_stop()
+            self._disconnect_simple()
         else:
             self.callback_manager.on_error("No device connected to disconnect from")
     
@@ -261,7 +530,7 @@ class BluetoothManager:
                 self.client = None
                 self.connected = False
                 self.paired = False
-                self.selected_characteristic = None
+                self.select_characteristic(None)
                 
         except Exception as e:
             error_msg = f"Disconnect error: {str(e)}"
@@ -286,11 +555,11 @@ class BluetoothManager:
         
         self.callback_manager.on_pairing_started()
         
-        @run_async
         async def pair_async() -> None:
             """Async pairing operation."""
             try:
-                await self.client.pair()
+                async with self._gatt_lock:
+                    await self.client.pair()
                 self.paired = True
                 
                 # Track paired device for cleanup on application exit
@@ -303,7 +572,7 @@ class BluetoothManager:
                 error_msg = f"Pairing failed: {str(e)}"
                 self.callback_manager.on_pairing_failed(error_msg)
         
-        pair_async()
+        self._submit(pair_async())
     
     def unpair_device(self) -> None:
         """Initiate unpairing from the currently connected BLE device.
@@ -318,114 +587,109 @@ class BluetoothManager:
         
         self.callback_manager.on_unpairing_started()
         
-        def unpair_thread() -> None:
-            """Background thread for unpairing operation."""
-            async def unpair() -> None:
-                """Async unpairing handler."""
-                try:
+        async def unpair() -> None:
+            """Async unpairing handler."""
+            try:
+                async with self._gatt_lock:
                     await self.client.unpair()
-                    self.paired = False
-                    
-                    # Remove from tracked paired devices
-                    if self.client.address in self.paired_devices:
-                        self.paired_devices.remove(self.client.address)
-                        
-                    self.callback_manager.on_unpaired_successfully()
+                self.paired = False
+                
+                # Remove from tracked paired devices
+                if self.client.address in self.paired_devices:
+                    self.paired_devices.remove(self.client.address)
                     
-                except Exception as e:
-                    error_msg = f"Unpairing failed: {str(e)}"
-                    self.callback_manager.on_unpairing_failed(error_msg)
-            
-            # Run unpairing in dedicated event loop
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(unpair())
+                self.callback_manager.on_unpaired_successfully()
+                
             except Exception as e:
-                error_msg = f"Unpair thread error: {str(e)}"
+                error_msg = f"Unpairing failed: {str(e)}"
                 self.callback_manager.on_unpairing_failed(error_msg)
-            finally:
-                # Clean up event loop
-                try:
-                    loop.close()
-                except:
-                    pass  # Ignore cleanup errors
         
-        thread = threading.Thread(target=unpair_thread, daemon=True)
-        thread.start()
+        self._submit(unpair())
     
-    def cleanup_all_paired_devices(self) -> None:
+    def cleanup_all_paired_devices(self) -> Optional[Future]:
         """Clean up all devices paired during this application session.
         
         This method is called during application shutdown to ensure no devices
         remain paired after the application closes. It attempts to unpair each
         device that was paired during this session.
         
+        Returns:
+            Future that completes when all unpair attempts finish, or None
+            if there was nothing to unpair
+            
         Note:
             Each device requires a temporary connection to perform unpairing.
             Failures are logged but don't prevent cleanup of other devices.
         """
         if not self.paired_devices:
             self.callback_manager.on_message("No devices to unpair")
-            return
+            return None
         
         device_count = len(self.paired_devices)
         self.callback_manager.on_message(f"Unpairing {device_count} device(s)...")
         
-        def cleanup_thread() -> None:
-            """Background thread for cleanup operations."""
-            async def cleanup_all() -> None:
-                """Async cleanup handler that unpairs all tracked devices."""
-                successful_unpairs = 0
-                
-                # Create a copy of the set to avoid modification during iteration
-                devices_to_unpair = list(self.paired_devices)
-                
-                for device_address in devices_to_unpair:
-                    try:
-                        # Create temporary client for unpairing
-                        temp_client = BleakClient(device_address)
-                        await temp_client.connect()
-                        await temp_client.unpair()
-                        await temp_client.disconnect()
-                        
-                        # Remove from tracking set
-                        self.paired_devices.discard(device_address)
-                        successful_unpairs += 1
-                        self.callback_manager.on_message(f"Unpaired device: {device_address}")
-                        
-                    except Exception as e:
-                        self.callback_manager.on_message(
-                            f"Failed to unpair {device_address}: {str(e)}"
-                        )
-                
-                # Report final status
-                if successful_unpairs == device_count:
-                    self.callback_manager.on_message("All devices unpaired successfully")
-                elif successful_unpairs > 0:
+        async def unpair_one(device_address: str, limit: asyncio.Semaphore) -> bool:
+            """Unpair a single device through a temporary connection."""
+            async with limit:
+                try:
+                    # Create temporary client for unpairing
+                    temp_client = BleakClient(device_address)
+                    await temp_client.connect()
+                    await temp_client.unpair()
+                    await temp_client.disconnect()
+                    
+                    # Remove from tracking set
+                    self.paired_devices.discard(device_address)
+                    self.callback_manager.on_message(f"Unpaired device: {device_address}")
+                    return True
+                    
+                except Exception as e:
                     self.callback_manager.on_message(
-                        f"Unpaired {successful_unpairs}/{device_count} devices"
+                        f"Failed to unpair {device_address}: {str(e)}"
                     )
-                else:
-                    self.callback_manager.on_message("No devices could be unpaired")
+                    return False
+        
+        async def cleanup_all() -> None:
+            """Async cleanup handler that unpairs all tracked devices concurrently."""
+            # Create a copy of the set to avoid modification during iteration
+            devices_to_unpair = list(self.paired_devices)
             
-            # Run cleanup in dedicated event loop
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(cleanup_all())
-            except Exception as e:
-                error_msg = f"Cleanup thread error: {str(e)}"
-                self.callback_manager.on_error(error_msg)
-            finally:
-                # Clean up event loop
-                try:
-                    loop.close()
-                except:
-                    pass  # Ignore cleanup errors
+            # Each unpair needs its own connection; overlap them up to the adapter's limit
+            limit = asyncio.Semaphore(UNPAIR_CONCURRENCY)
+            results = await asyncio.gather(
+                *(unpair_one(device_address, limit) for device_address in devices_to_unpair)
+            )
+            successful_unpairs = sum(results)
+            
+            # Report final status
+            if successful_unpairs == device_count:
+                self.callback_manager.on_message("All devices unpaired successfully")
+            elif successful_unpairs > 0:
+                self.callback_manager.on_message(
+                    f"Unpaired {successful_unpairs}/{device_count} devices"
+                )
+            else:
+                self.callback_manager.on_message("No devices could be unpaired")
         
-        thread = threading.Thread(target=cleanup_thread, daemon=True)
-        thread.start()
+        return self._submit(cleanup_all())
+    
+    def select_characteristic(self, characteristic) -> None:
+        """Set the characteristic used for operations and precompute its details.
+        
+        Args:
+            characteristic: BLE characteristic object, or None to clear the selection
+            
+        Note:
+            The UUID string and write mode are resolved once here so that
+            repeated writes do not rescan the characteristic properties.
+        """
+        self.selected_characteristic = characteristic
+        if characteristic:
+            self.selected_characteristic_uuid = str(characteristic.uuid)
+            self.selected_write_response = "write-without-response" not in characteristic.properties
+        else:
+            self.selected_characteristic_uuid = None
+            self.selected_write_response = True
     
     def send_data(self, characteristic, data_str: str) -> None:
         """Send string data to a BLE characteristic.
@@ -447,51 +711,35 @@ class BluetoothManager:
             self.callback_manager.on_error("No device connected for sending data")
             return
         
+        if characteristic is not self.selected_characteristic:
+            self.select_characteristic(characteristic)
+        
+        # Capture the precomputed write target for this send
+        char_uuid = self.selected_characteristic_uuid
+        response = self.selected_write_response
+        
         self.callback_manager.on_send_started(data_str)
         
-        def write_thread() -> None:
-            """Background thread for write operation."""
-            async def write_data() -> None:
-                """Async write handler that sends data to characteristic."""
-                try:
-                    # Encode string data to bytes
-                    data_bytes = data_str.encode('utf-8')
-                    
-                    # Choose write mode based on characteristic capabilities
-                    if "write-without-response" in characteristic.properties:
-                        # Fast write without waiting for response
-                        await self.client.write_gatt_char(
-                            characteristic.uuid, data_bytes, response=False
-                        )
-                    else:
-                        # Reliable write with response confirmation
-                        await self.client.write_gatt_char(
-                            characteristic.uuid, data_bytes, response=True
-                        )
-                    
-                    self.callback_manager.on_send_success(data_str)
-                    
-                except Exception as e:
-                    error_msg = f"Send failed: {str(e)}"
-                    self.callback_manager.on_error(error_msg)
-            
-            # Run write operation in dedicated event loop
+        async def write_data() -> None:
+            """Async write handler that sends data to characteristic."""
             try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(write_data())
+                # Encode string data to bytes, reusing the last encoding for repeated sends
+                last_str, data_bytes = self._last_encoded
+                if data_str != last_str:
+                    data_bytes = data_str.encode('utf-8')
+                    self._last_encoded = (data_str, data_bytes)
+                
+                # Write without response when supported, otherwise wait for confirmation
+                async with self._gatt_lock:
+                    await self.client.write_gatt_char(char_uuid, data_bytes, response=response)
+                
+                self.callback_manager.on_send_success(data_str)
+                
             except Exception as e:
-                error_msg = f"Write thread error: {str(e)}"
+                error_msg = f"Send failed: {str(e)}"
                 self.callback_manager.on_error(error_msg)
-            finally:
-                # Clean up event loop
-                try:
-                    loop.close()
-                except:
-                    pass  # Ignore cleanup errors
         
-        thread = threading.Thread(target=write_thread, daemon=True)
-        thread.start()
+        self._submit(write_data())
     
     def read_data(self, characteristic) -> None:
         """Read data from a BLE characteristic.
@@ -511,51 +759,25 @@ class BluetoothManager:
             self.callback_manager.on_error("No device connected for reading data")
             return
         
-        self.callback_manager.on_read_started(characteristic.uuid)
+        char_uuid = characteristic.uuid
+        self.callback_manager.on_read_started(char_uuid)
         
-        def read_thread() -> None:
-            """Background thread for read operation."""
-            async def read_data() -> None:
-                """Async read handler that retrieves data from characteristic."""
-                try:
-                    # Read raw data from characteristic
-                    data = await self.client.read_gatt_char(characteristic.uuid)
-                    
-                    # Format data for display with timestamp
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-                    
-                    try:
-                        # Try to decode as UTF-8 text
-                        decoded_str = data.decode('utf-8')
-                        message = f"[{timestamp}] Read: '{decoded_str}'\n"
-                    except UnicodeDecodeError:
-                        # Fall back to hex representation for binary data
-                        hex_str = ' '.join([f'{b:02x}' for b in data])
-                        message = f"[{timestamp}] Read (hex): {hex_str}\n"
-                    
-                    self.callback_manager.on_data_received(message)
-                    
-                except Exception as e:
-                    error_msg = f"Read failed: {str(e)}"
-                    self.callback_manager.on_error(error_msg)
-            
-            # Run read operation in dedicated event loop
+        async def read_data() -> None:
+            """Async read handler that retrieves data from characteristic."""
             try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(read_data())
+                # Read raw data from characteristic
+                async with self._gatt_lock:
+                    data = await self.client.read_gatt_char(char_uuid)
+                
+                # Format data for display with timestamp
+                message = format_data_message(data, "Read")
+                self.callback_manager.on_data_received(message)
+                
             except Exception as e:
-                error_msg = f"Read thread error: {str(e)}"
+                error_msg = f"Read failed: {str(e)}"
                 self.callback_manager.on_error(error_msg)
-            finally:
-                # Clean up event loop
-                try:
-                    loop.close()
-                except:
-                    pass  # Ignore cleanup errors
         
-        thread = threading.Thread(target=read_thread, daemon=True)
-        thread.start()
+        self._submit(read_data())
     
     def start_notifications(self, characteristic) -> None:
         """Start receiving notifications/indications from a BLE characteristic.
@@ -579,97 +801,125 @@ class BluetoothManager:
             self.callback_manager.on_error("No device connected for notifications")
             return
         
-        self.selected_characteristic = characteristic
+        self.select_characteristic(characteristic)
+        char_uuid = self.selected_characteristic_uuid
         self.notification_active = True
+        # A fresh token ends any earlier session, even if the shared flag is set again
+        session = object()
+        self._notify_session = session
         self.callback_manager.on_notifications_starting()
         
-        def notification_thread() -> None:
-            """Background thread for notification handling."""
-            async def try_notifications() -> None:
-                """Async handler that attempts real BLE notifications with polling fallback."""
-                try:
-                    def notification_handler(sender: int, data: bytearray) -> None:
-                        """Callback for processing incoming BLE notifications.
-                        
-                        Args:
-                            sender: Characteristic handle (unused)
-                            data: Raw notification data
-                        """
-                        try:
-                            # Format notification data with timestamp
-                            timestamp = datetime.now().strftime("%H:%M:%S")
-                            
-                            try:
-                                # Try UTF-8 decoding first
-                                decoded_str = data.decode('utf-8')
-                                message = f"[{timestamp}] Notification: '{decoded_str}'\n"
-                            except UnicodeDecodeError:
-                                # Fall back to hex for binary data
-                                hex_str = ' '.join([f'{b:02x}' for b in data])
-                                message = f"[{timestamp}] Notification (hex): {hex_str}\n"
-                                
-                        except Exception as e:
-                            # Handle any formatting errors
-                            timestamp = datetime.now().strftime("%H:%M:%S")
-                            message = f"[{timestamp}] Notification (error): {str(e)}\n"
-                        
-                        # Add to notification queue for thread-safe GUI updates
-                        if hasattr(self, '_notification_queue'):
-                            self._notification_queue.append(message)
-                    
-                    # Initialize thread-safe notification queue
-                    self._notification_queue = []
-                    
-                    # Attempt to start BLE notifications
-                    await self.client.start_notify(characteristic.uuid, notification_handler)
-                    self.callback_manager.on_notifications_started_real()
+        # Subscribing cannot succeed without notify/indicate, so go straight to polling
+        if NOTIFY_PROPERTIES.isdisjoint(characteristic.properties):
+            self._start_polling_fallback(characteristic, session)
+            return
+        
+        async def try_notifications(previous_future: Optional[Future]) -> None:
+            """Async handler that attempts real BLE notifications with polling fallback."""
+            # Let the previous session finish its stop_notify before subscribing again
+            if previous_future and not previous_future.done():
+                await asyncio.wrap_future(previous_future)
+            if self._notify_session is not session:
+                return
+            
+            try:
+                def notification_handler(sender: int, data: bytearray) -> None:
+                    """Callback for processing incoming BLE notifications.
                     
-                    # Process notification queue until stopped
-                    while self.notification_active and self.connected:
-                        # Process queued notifications
-                        if hasattr(self, '_notification_queue') and self._notification_queue:
-                            message = self._notification_queue.pop(0)
-                            self.callback_manager.on_data_received(message)
-                            
-                        # Brief pause between queue checks
-                        await asyncio.sleep(NOTIFICATION_CHECK_INTERVAL)
+                    Args:
+                        sender: Characteristic handle (unused)
+                        data: Raw notification data
+                    """
+                    # Queue the raw payload with its arrival time; formatting is
+                    # deferred to the consumer so dropped entries cost nothing.
+                    # bleak invokes this on the event loop thread.
+                    # Drop the oldest entry rather than grow without bound
+                    if queue.full():
+                        queue.get_nowait()
+                    queue.put_nowait((get_timestamp(), data))
+                
+                # Each session owns its queue, so a session that is still
+                # winding down never touches the one that replaced it
+                queue = asyncio.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+                
+                # Attempt to start BLE notifications, retrying transient failures
+                await self._start_notify_with_retry(char_uuid, notification_handler, session)
+                self.callback_manager.on_notifications_started_real()
+                
+                # Bind the per-message calls once; this loop runs for every notification
+                get_entry = queue.get
+                on_data_received = self.callback_manager.on_data_received
+                
+                # Process notification queue until stopped
+                while self._notify_session is session and self.connected:
+                    # Wake as soon as a notification arrives, re-checking the
+                    # stop flags at least every NOTIFICATION_CHECK_INTERVAL
+                    try:
+                        timestamp, data = await asyncio.wait_for(
+                            get_entry(), timeout=NOTIFICATION_CHECK_INTERVAL
+                        )
+                    except asyncio.TimeoutError:
+                        continue
                     
-                    # Clean up notifications when stopping
                     try:
-                        await self.client.stop_notify(characteristic.uuid)
-                    except:
-                        pass  # Ignore stop notification errors
+                        # Format notification data with its arrival timestamp
+                        message = format_data_message(data, "Notification", timestamp)
+                    except Exception as e:
+                        # Handle any formatting errors
+                        message = f"[{timestamp}] Notification (error): {str(e)}\n"
                     
-                except Exception as e:
-                    # Fall back to polling if real notifications fail
-                    error_msg = f"Notifications failed, falling back to polling: {str(e)}"
-                    self.callback_manager.on_message(error_msg)
-                    self._start_polling_fallback(characteristic)
-            
-            # Run notification handling in dedicated event loop
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(try_notifications())
-            except Exception as e:
-                error_msg = f"Notification thread failed: {str(e)}"
-                self.callback_manager.on_message(error_msg)
-                self._start_polling_fallback(characteristic)
-            finally:
-                # Clean up event loop
+                    on_data_received(message)
+                
+                # Clean up notifications when stopping
                 try:
-                    loop.close()
+                    async with self._gatt_lock:
+                        await self.client.stop_notify(char_uuid)
                 except:
-                    pass  # Ignore cleanup errors
+                    pass  # Ignore stop notification errors
+                
+            except Exception as e:
+                # Fall back to polling if real notifications fail, unless
+                # this session was stopped or replaced in the meantime
+                if self._notify_session is session:
+                    error_msg = f"Notifications failed, falling back to polling: {str(e)}"
+                    self.callback_manager.on_message(error_msg)
+                    self._start_polling_fallback(characteristic, session)
         
-        thread = threading.Thread(target=notification_thread, daemon=True)
-        thread.start()
+        self._notify_future = self._submit(try_notifications(self._notify_future))
     
-    def _start_polling_fallback(self, characteristic) -> None:
+    async def _start_notify_with_retry(self, char_uuid: str, handler: Callable, session: object) -> None:
+        """Subscribe to a characteristic, backing off between failed attempts.
+        
+        Args:
+            char_uuid: UUID of the characteristic to subscribe to
+            handler: Notification callback passed to start_notify
+            session: Token of the session subscribing; retries stop once it is replaced
+            
+        Raises:
+            BleakError: If every attempt fails or the device reports that
+                notifications are not supported
+        """
+        for delay in NOTIFY_RETRY_DELAYS:
+            try:
+                async with self._gatt_lock:
+                    await self.client.start_notify(char_uuid, handler)
+                return
+            except BleakError as e:
+                # Retrying cannot help if the device refuses outright or went away
+                if "not supported" in str(e).lower() or not (self._notify_session is session and self.connected):
+                    raise
+                await asyncio.sleep(delay)
+        
+        # Final attempt; its error drives the polling fallback
+        async with self._gatt_lock:
+            await self.client.start_notify(char_uuid, handler)
+    
+    def _start_polling_fallback(self, characteristic, session: object) -> None:
         """Fallback notification method using periodic characteristic reads.
         
         Args:
             characteristic: BLE characteristic to poll for data changes
+            session: Token of the notify/poll session the poller belongs to
             
         This method is used when real BLE notifications are not supported or fail.
         It periodically reads the characteristic value and reports any data found.
@@ -678,97 +928,102 @@ class BluetoothManager:
         self.callback_manager.on_notifications_started_polling()
         
         # Send initial status message
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = get_timestamp()
         test_message = f"[{timestamp}] Polling started - checking for data every {POLLING_INTERVAL}s...\n"
         self.callback_manager.on_data_received(test_message)
         
-        def poll_thread() -> None:
-            """Background thread that performs periodic characteristic reads."""
-            while self.notification_active and self.connected:
-                try:
-                    # Wait between polls
-                    time.sleep(POLLING_INTERVAL)
-                    
-                    # Check if we should continue polling
-                    if not self.notification_active or not self.connected:
-                        break
-                    
-                    async def poll_read() -> None:
-                        """Async read operation for polling."""
-                        try:
-                            # Verify connection is still valid before reading
-                            if self.client and self.connected and self.notification_active:
-                                # Read current characteristic value
-                                data = await self.client.read_gatt_char(characteristic.uuid)
-                                
-                                # Format polled data with timestamp
-                                timestamp = datetime.now().strftime("%H:%M:%S")
-                                
-                                try:
-                                    # Try UTF-8 decoding
-                                    decoded_str = data.decode('utf-8')
-                                    message = f"[{timestamp}] Polled: '{decoded_str}'\n"
-                                except UnicodeDecodeError:
-                                    # Use hex representation for binary data
-                                    hex_str = ' '.join([f'{b:02x}' for b in data])
-                                    message = f"[{timestamp}] Polled (hex): {hex_str}\n"
-                                
-                                # Send to GUI if still active
-                                if self.notification_active:
-                                    self.callback_manager.on_data_received(message)
-                                    
-                        except Exception:
-                            # Silently ignore read errors during polling
-                            # This is normal if device disconnects or characteristic becomes unavailable
-                            pass
-                    
-                    # Execute async read in temporary event loop
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        loop.run_until_complete(poll_read())
-                    finally:
-                        # Clean up temporary event loop
-                        try:
-                            loop.close()
-                        except:
-                            pass  # Ignore cleanup errors
-                            
-                except Exception:
-                    # Exit polling thread on any major errors
-                    break
-        
-        thread = threading.Thread(target=poll_thread, daemon=True)
-        thread.start()
+        self._poll_characteristic(characteristic, session)
+    
+    @run_async
+    async def _poll_characteristic(self, characteristic, session: object) -> None:
+        """Background async method that performs periodic characteristic reads.
+        
+        Args:
+            characteristic: BLE characteristic to poll for data changes
+            session: Token of the notify/poll session; polling ends once it is replaced
+        """
+        char_uuid = characteristic.uuid
+        
+        # Each polling session gets its own event so a restarted session
+        # cannot keep a previous poller alive
+        stop_event = asyncio.Event()
+        self._stop_event = stop_event
+        
+        while self._notify_session is session and self.connected:
+            # Wait between polls, waking immediately when a stop is requested
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=POLLING_INTERVAL)
+                break
+            except asyncio.TimeoutError:
+                pass
+            
+            # Verify connection is still valid before reading
+            if not (self.client and self.connected and self._notify_session is session):
+                break
+            
+            try:
+                # Read current characteristic value
+                async with self._gatt_lock:
+                    data = await self.client.read_gatt_char(char_uuid)
+            except Exception:
+                # Silently ignore read errors during polling
+                # This is normal if device disconnects or characteristic becomes unavailable
+                continue
+            
+            # Send to GUI if still active
+            if self._notify_session is session:
+                self.callback_manager.on_data_received(format_data_message(data, "Polled"))
     
     def stop_notifications(self) -> None:
         """Stop active notifications or polling.
         
-        Sets the notification_active flag to False, which signals background
-        threads to stop processing notifications or polling operations.
+        Sets the notification_active flag to False and ends the current session,
+        which signals background coroutines to stop processing notifications or
+        polling operations.
         """
         self.notification_active = False
+        self._signal_stop()
         self.callback_manager.on_notifications_stopped()
     
-    def cleanup(self) -> None:
+    def _signal_stop(self) -> None:
+        """End the current notify/poll session and wake the polling coroutine.
+        
+        Clearing the session token stops the notification consumer and poller
+        of that session even if a new session sets notification_active again.
+        """
+        self._notify_session = None
+        stop_event = self._stop_event
+        if stop_event is not None:
+            self._loop.call_soon_threadsafe(stop_event.set)
+    
+    def cleanup(self) -> Optional[Future]:
         """Clean up all BLE resources and unpair devices.
         
         This method is called during application shutdown to ensure proper
         cleanup of BLE connections and remove any paired devices from the system.
         
+        Returns:
+            Future that completes when unpairing finishes, or None if no
+            cleanup work is pending
+            
         Note:
-            Stops all active operations and gives cleanup time to complete
-            before the application fully exits.
+            Stops all active operations without blocking; callers should wait
+            on the returned future before the application fully exits.
         """
-        # Stop all active BLE operations
+        # Stop all active BLE operations; a connect in progress must not
+        # reopen a paused scan while unpairing runs
         self.scanning = False
+        self._scan_session = None
+        self._resume_scan_after_connect = False
+        # Safety net if closing interrupted a connection attempt
+        self.restore_connection_interval(final=True)
         self.notification_active = False
+        self._signal_stop()
         
         # Clean up paired devices if any exist
         if self.paired_devices:
-            self.cleanup_all_paired_devices()
-            # Allow cleanup operations time to complete
-            time.sleep(CLEANUP_TIMEOUT)
+            return self.cleanup_all_paired_devices()
+        return None
 
 
 class BLEGUIApp:
@@ -814,6 +1069,17 @@ class BLEGUIApp:
         # GUI state tracking variables
         self.selected_device_address: Optional[str] = None
         self.selected_characteristic = None
+        self._chars_by_uuid: Dict[str, Any] = {}  # Characteristic objects by UUID string
+        self._device_update_pending = False  # Device tree flush already scheduled
+        self._pending_device_updates: Dict[str, Optional[Dict[str, Any]]] = {}  # Rows to add/refresh/remove
+        self._device_update_lock = threading.Lock()  # Guards the two fields above
+        self._rx_queue = deque(maxlen=RX_QUEUE_SIZE)  # Received messages awaiting display
+        self._rx_drain_pending = False  # Received data drain already scheduled
+        self._log_queue = deque(maxlen=MAX_TEXT_LINES)  # Formatted log lines awaiting display
+        self._log_flush_pending = False  # Log flush already scheduled
+        self._window_visible = True  # Window is mapped; text flushes are held while minimized
+        self._closing = False  # Close requested, shutdown in progress
+        self._closed = False  # Window has been destroyed
         
         # Build the complete user interface
         self.setup_ui()
@@ -995,6 +1261,7 @@ class BLEGUIApp:
         ttk.Label(parent, text="Select Characteristic:").grid(row=0, column=0, sticky=tk.W, pady=(0,5))
         self.char_var = tk.StringVar()
         self.char_combo = ttk.Combobox(parent, textvariable=self.char_var, state="readonly", width=35)
+        self.char_combo.char_uuids = ()  # UUIDs matching the dropdown entries, by index
         self.char_combo.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0,10))
         self.char_combo.bind("<<ComboboxSelected>>", self._on_char_select)
     
@@ -1080,9 +1347,9 @@ class BLEGUIApp:
             item = self.device_tree.item(selection[0])
             address = item['values'][1]
             
-            if address in self.bluetooth.devices:
+            device_info = self.bluetooth.devices.get(address)
+            if device_info is not None:
                 self.selected_device_address = address
-                device_info = self.bluetooth.devices[address]
                 self._update_device_info(device_info)
                 self.connect_button.config(state="normal")
     
@@ -1105,17 +1372,16 @@ class BLEGUIApp:
     def _on_char_select(self, event):
         """Handle characteristic selection"""
         selection = self.char_combo.current()
-        if selection >= 0 and hasattr(self.char_combo, 'char_uuids'):
+        if selection >= 0 and self.char_combo.char_uuids:
             char_uuid = self.char_combo.char_uuids[selection]
             
-            # Find the characteristic object
-            for service in self.bluetooth.client.services:
-                for char in service.characteristics:
-                    if str(char.uuid) == char_uuid:
-                        self.selected_characteristic = char
-                        self._update_comm_buttons()
-                        self.log(f"Selected characteristic: {char_uuid}")
-                        return
+            # Look up the characteristic object indexed by _display_services
+            char = self._chars_by_uuid.get(str(char_uuid))
+            if char:
+                self.selected_characteristic = char
+                self.bluetooth.select_characteristic(char)
+                self._update_comm_buttons()
+                self.log(f"Selected characteristic: {char_uuid}")
     
     def _send_data(self):
         """Send data"""
@@ -1156,20 +1422,22 @@ class BLEGUIApp:
             self.notify_button.config(state="disabled")
             return
         
+        props = frozenset(self.selected_characteristic.properties)
+        
         # Enable send button if characteristic supports write
-        if any(prop in self.selected_characteristic.properties for prop in ["write", "write-without-response"]):
+        if props & WRITE_PROPERTIES:
             self.send_button.config(state="normal")
         else:
             self.send_button.config(state="disabled")
         
         # Enable read button if characteristic supports read
-        if "read" in self.selected_characteristic.properties:
+        if "read" in props:
             self.read_button.config(state="normal")
         else:
             self.read_button.config(state="disabled")
         
         # Enable notify button if characteristic supports notify/indicate
-        if any(prop in self.selected_characteristic.properties for prop in ["notify", "indicate"]):
+        if props & NOTIFY_PROPERTIES:
             if self.bluetooth.notification_active:
                 self.notify_button.config(state="normal", text="Unsubscribe")
             else:
@@ -1179,10 +1447,31 @@ class BLEGUIApp:
     
     def log(self, message):
         """Add a timestamped message to the log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        timestamp = get_timestamp()
+        self._log_queue.append(f"[{timestamp}] {message}\n")
+        
+        # Write queued lines once per interval instead of one widget update per line
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after(LOG_UPDATE_INTERVAL, self._flush_log)
+    
+    def _flush_log(self):
+        """Write all queued log lines and scroll to the newest message"""
+        # While minimized, leave lines queued (flag still set) until the window is shown
+        if not self._window_visible:
+            return
+        
+        # Reset the flag first so lines logged during the flush schedule another
+        self._log_flush_pending = False
+        
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        
+        if lines:
+            self.log_text.insert(tk.END, "".join(lines))
+            self._trim_text(self.log_text)
+            self.log_text.see(tk.END)
     
     # Callback methods - called by BluetoothManager
     def on_scan_started(self):
@@ -1196,9 +1485,22 @@ class BLEGUIApp:
         self.scan_button.config(text="Start Scan")
         self.log("Stopped BLE scan")
     
-    def on_devices_updated(self, devices):
-        """Called when device list is updated"""
-        self.root.after(0, self._update_device_tree, devices)
+    def on_scan_resumed(self):
+        """Called when scanning resumes after a connection attempt"""
+        self.scan_button.config(text="Stop Scan")
+        self.log("Resumed BLE scan")
+    
+    def on_device_added(self, address, device_info):
+        """Called when a new device is discovered"""
+        self._queue_device_update(address, device_info)
+    
+    def on_device_updated(self, address, device_info):
+        """Called when a known device's details change"""
+        self._queue_device_update(address, device_info)
+    
+    def on_device_removed(self, address):
+        """Called when a device has stopped advertising"""
+        self._queue_device_update(address, None)
     
     def on_connection_started(self, device_info):
         """Called when connection attempt starts"""
@@ -1217,7 +1519,9 @@ class BLEGUIApp:
         self.connect_button.config(text="Connect", state="normal")
         self.connection_status.config(text="Status: Connection Failed", foreground="red")
         self.log(f"Connection failed: {error_msg}")
-        messagebox.showerror("Connection Error", f"Failed to connect: {error_msg}")
+        # This runs on the BLE loop thread; showing the modal dialog from the
+        # Tk event loop keeps BLE work flowing until the user dismisses it
+        self.root.after(0, messagebox.showerror, "Connection Error", f"Failed to connect: {error_msg}")
     
     def on_disconnected(self):
         """Called when device is disconnected"""
@@ -1227,8 +1531,10 @@ class BLEGUIApp:
         self.services_text.delete(1.0, tk.END)
         self.received_text.delete(1.0, tk.END)
         self.char_combo['values'] = ()
+        self.char_combo.char_uuids = ()
         self.char_var.set("")
         self.selected_characteristic = None
+        self._chars_by_uuid.clear()
         self.send_button.config(state="disabled")
         self.read_button.config(state="disabled")
         self.notify_button.config(state="disabled", text="Subscribe")
@@ -1286,22 +1592,28 @@ class BLEGUIApp:
         self.log(f"Reading from: {char_uuid}")
     
     def on_data_received(self, message):
-        """Called when data is received"""
-        self.root.after(0, self._display_received_data, message)
+        """Called when data is received; inserts are batched per interval"""
+        self._rx_queue.append(message)
+        if not self._rx_drain_pending:
+            self._rx_drain_pending = True
+            self.root.after(RX_UPDATE_INTERVAL, self._drain_rx_queue)
     
     def on_notifications_starting(self):
         """Called when notifications are starting"""
-        self.notify_button.config(text="Unsubscribe")
+        # Block repeated clicks until the subscription has settled
+        self.notify_button.config(text="Unsubscribe", state="disabled")
         self.polling_status.config(text="● Starting...", foreground="orange")
         self.log(f"Starting notifications for: {self.selected_characteristic.uuid}")
     
     def on_notifications_started_real(self):
         """Called when real BLE notifications start"""
+        self.notify_button.config(state="normal")
         self.polling_status.config(text="● Notifications", foreground="blue")
         self.log("Real BLE notifications started")
     
     def on_notifications_started_polling(self):
         """Called when polling fallback starts"""
+        self.notify_button.config(state="normal")
         self.polling_status.config(text="● Polling", foreground="green")
         self.log("Using polling fallback method")
     
@@ -1322,67 +1634,131 @@ class BLEGUIApp:
     # Helper methods for UI updates
     def _clear_device_tree(self):
         """Clear all items from device tree"""
+        with self._device_update_lock:
+            self._pending_device_updates.clear()
         for item in self.device_tree.get_children():
             self.device_tree.delete(item)
     
-    def _update_device_tree(self, devices):
-        """Update the device tree with discovered devices"""
-        self._clear_device_tree()
+    def _queue_device_update(self, address, device_info):
+        """Buffer a device row change; tree updates are coalesced per interval.
         
-        # Add all devices
-        for addr, device_info in devices.items():
-            self.device_tree.insert("", "end", values=(
+        A device_info of None removes the row.
+        """
+        with self._device_update_lock:
+            self._pending_device_updates[address] = device_info
+            if self._device_update_pending:
+                return
+            self._device_update_pending = True
+        self.root.after(DEVICE_UPDATE_INTERVAL, self._flush_device_updates)
+    
+    def _flush_device_updates(self):
+        """Apply all device row changes buffered since the last flush"""
+        with self._device_update_lock:
+            pending = self._pending_device_updates
+            self._pending_device_updates = {}
+            self._device_update_pending = False
+        
+        # Rows are keyed by device address, so only changed rows are touched
+        for address, device_info in pending.items():
+            if device_info is None:
+                # Device expired; drop its row if it was ever shown
+                if self.device_tree.exists(address):
+                    self.device_tree.delete(address)
+                continue
+            values = (
                 device_info['name'],
                 device_info['address'],
                 f"{device_info['rssi']} dBm"
-            ))
+            )
+            if self.device_tree.exists(address):
+                self.device_tree.item(address, values=values)
+            else:
+                self.device_tree.insert("", "end", iid=address, values=values)
     
     def _display_services(self, services):
         """Display device services and characteristics"""
         self.services_text.delete(1.0, tk.END)
-        char_list = []
+        self._chars_by_uuid.clear()
+        parts = []  # Services text, inserted into the widget in one call
+        char_displays = []
+        char_uuids = []
         
         for service in services:
-            self.services_text.insert(tk.END, f"Service: {service.uuid}\n")
+            parts.append(f"Service: {service.uuid}\n")
             if service.description:
-                self.services_text.insert(tk.END, f"  Description: {service.description}\n")
+                parts.append(f"  Description: {service.description}\n")
             
             for char in service.characteristics:
-                self.services_text.insert(tk.END, f"  Characteristic: {char.uuid}\n")
+                # Keep the first instance when a UUID appears in several services
+                self._chars_by_uuid.setdefault(str(char.uuid), char)
+                parts.append(f"  Characteristic: {char.uuid}\n")
                 if char.description:
-                    self.services_text.insert(tk.END, f"    Description: {char.description}\n")
+                    parts.append(f"    Description: {char.description}\n")
                 
+                props = frozenset(char.properties)
                 properties = []
-                if "read" in char.properties:
+                if "read" in props:
                     properties.append("Read")
-                if "write" in char.properties or "write-without-response" in char.properties:
+                if props & WRITE_PROPERTIES:
                     properties.append("Write")
-                if "notify" in char.properties:
+                if "notify" in props:
                     properties.append("Notify")
-                if "indicate" in char.properties:
+                if "indicate" in props:
                     properties.append("Indicate")
                 
                 if properties:
-                    self.services_text.insert(tk.END, f"    Properties: {', '.join(properties)}\n")
+                    properties_str = ', '.join(properties)
+                    parts.append(f"    Properties: {properties_str}\n")
                     
-                    # Add writable/readable characteristics to dropdown
-                    if any(prop in char.properties for prop in ["write", "write-without-response", "read", "notify", "indicate"]):
-                        char_display = f"{char.uuid} ({', '.join(properties)})"
-                        char_list.append((char_display, char.uuid))
+                    # Add readable/writable/subscribable characteristics to dropdown
+                    char_displays.append(f"{char.uuid} ({properties_str})")
+                    char_uuids.append(char.uuid)
                 
-                self.services_text.insert(tk.END, "\n")
+                parts.append("\n")
             
-            self.services_text.insert(tk.END, "\n")
+            parts.append("\n")
+        
+        self.services_text.insert(tk.END, "".join(parts))
+        
+        # Update characteristic dropdown in a single assignment; clear it
+        # when the device exposes nothing selectable so stale entries go away
+        self.char_combo['values'] = tuple(char_displays)
+        self.char_combo.char_uuids = tuple(char_uuids)
+    
+    def _drain_rx_queue(self):
+        """Display all received data buffered since the last drain"""
+        # While minimized, leave messages queued (flag still set) until the window is shown
+        if not self._window_visible:
+            return
+        
+        # Reset the flag first so messages arriving during the drain schedule another
+        self._rx_drain_pending = False
+        
+        batch = []
+        while self._rx_queue:
+            batch.append(self._rx_queue.popleft())
         
-        # Update characteristic dropdown
-        if char_list:
-            self.char_combo['values'] = [item[0] for item in char_list]
-            self.char_combo.char_uuids = [item[1] for item in char_list]
+        if batch:
+            self._display_received_data("".join(batch))
     
     def _display_received_data(self, message):
         """Display received data in the text widget"""
+        # Only follow new data if the user has not scrolled up to inspect older lines
+        at_bottom = self.received_text.yview()[1] >= 1.0
         self.received_text.insert(tk.END, message)
-        self.received_text.see(tk.END)
+        self._trim_text(self.received_text)
+        if at_bottom:
+            self.received_text.see(tk.END)
+    
+    def _trim_text(self, widget):
+        """Drop the oldest lines once a text widget exceeds MAX_TEXT_LINES.
+        
+        Trims down to TRIM_TEXT_LINES in a single delete so the cost is
+        amortized over many inserts.
+        """
+        line_count = int(widget.index("end-1c").split(".")[0])
+        if line_count > MAX_TEXT_LINES:
+            widget.delete("1.0", f"{line_count - TRIM_TEXT_LINES}.0")
     
     def run(self):
         """Start the application"""
@@ -1391,39 +1767,88 @@ class BLEGUIApp:
         self.log("For some devices, you may need to click 'Pair' after connecting.")
         self.log("Paired devices will be automatically unpaired when you close the app.")
         
-        # Handle window close event
-        def on_closing():
-            self.log("Closing application...")
-            
-            # Show a message if we're about to unpair devices
-            if self.bluetooth.paired_devices:
-                self.log(f"Unpairing {len(self.bluetooth.paired_devices)} paired device(s)...")
-                # Start cleanup in background
-                self.bluetooth.cleanup()
-                # Give it a moment to start
-                self.root.after(2000, self._force_close)  # Force close after 2 seconds
-            else:
-                self._force_close()
-        
-        def on_closing_immediate():
-            """Immediate close without cleanup (in case cleanup hangs)"""
-            self._force_close()
-        
         # Bind both close events
-        self.root.protocol("WM_DELETE_WINDOW", on_closing)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
         
         # Add keyboard shortcut for immediate close (Ctrl+Q)
-        self.root.bind("<Control-q>", lambda e: on_closing_immediate())
+        self.root.bind("<Control-q>", self._on_ctrl_q)
+        
+        # Hold text widget updates while the window is minimized
+        self.root.bind("<Map>", self._on_map)
+        self.root.bind("<Unmap>", self._on_unmap)
         
         self.root.mainloop()
     
+    def _on_closing(self):
+        """Handle window close event"""
+        # Ignore further close requests while shutdown is in progress
+        if self._closing:
+            return
+        self._closing = True
+        self.log("Closing application...")
+        
+        # Show a message if we're about to unpair devices
+        paired_count = len(self.bluetooth.paired_devices)
+        if paired_count:
+            self.log(f"Unpairing {paired_count} paired device(s)...")
+            # Start cleanup in background and close as soon as it completes
+            cleanup_future = self.bluetooth.cleanup()
+            if cleanup_future:
+                cleanup_future.add_done_callback(self._on_cleanup_done)
+            # Watchdog in case unpairing hangs
+            self.root.after(int(CLEANUP_TIMEOUT * 1000), self._force_close)
+        else:
+            self._force_close()
+    
+    def _on_map(self, event):
+        """Resume text updates and flush anything held while minimized"""
+        # Child widgets share the toplevel's bindtag; only react to the window itself
+        if event.widget is not self.root:
+            return
+        self._window_visible = True
+        if self._rx_drain_pending:
+            self._drain_rx_queue()
+        if self._log_flush_pending:
+            self._flush_log()
+    
+    def _on_unmap(self, event):
+        """Hold text updates while the window is minimized"""
+        if event.widget is self.root:
+            self._window_visible = False
+    
+    def _on_cleanup_done(self, _future):
+        """Close the window once cleanup finishes (runs on the BLE loop thread)"""
+        # The CLEANUP_TIMEOUT watchdog may already have destroyed the window
+        if self._closed:
+            return
+        try:
+            self.root.after_idle(self._force_close)
+        except (tk.TclError, RuntimeError):
+            pass  # Window torn down between the check and the call
+    
+    def _on_ctrl_q(self, _event):
+        """Immediate close without cleanup (in case cleanup hangs)"""
+        self._force_close()
+    
     def _force_close(self):
         """Force close the application"""
+        # Cleanup completion and the watchdog may both fire; only close once
+        if self._closed:
+            return
+        self._closed = True
+        
+        # Every exit path ends here, including Ctrl+Q and closes with nothing
+        # to unpair; the loop thread dies with the process, so restore now
+        self.bluetooth.restore_connection_interval(final=True)
+        
+        # destroy() also ends mainloop(), so a separate quit() is not needed
         try:
-            self.root.quit()
+            # Drop queued flushes and the watchdog so none run against a dying window
+            for after_id in self.root.tk.splitlist(self.root.tk.call('after', 'info')):
+                self.root.after_cancel(after_id)
             self.root.destroy()
-        except:
-            pass  # Ignore any errors during close
+        except tk.TclError:
+            pass  # Window already torn down
 
 
 if __name__ == "__main__":
@@ -1431,7 +1856,9 @@ if __name__ == "__main__":
         app = BLEGUIApp()
         app.run()
     except Exception as e:
-        print(f"Error starting application: {e}")
-        print("\nMake sure you have the required dependencies installed:")
-        print("pip install bleak")
-        print("\nNote: This application requires Bluetooth support on your system.")
\ No newline at end of file
+        sys.stderr.write(
+            f"Error starting application: {e}\n"
+            "\nMake sure you have the required dependencies installed:\n"
+            "pip install bleak\n"
+            "\nNote: This application requires Bluetooth support on your system.\n"
+        )
\ No newline at end of file